@@ -1,7 +1,7 @@
 try:
-    from physics_types import Ball, Surface, Point, SurfaceType
+    from physics_types import Ball, Surface, Point, SurfaceType, maybe_njit
 except ImportError:
-    from physics_engine.physics_types import Ball, Surface, Point, SurfaceType
+    from physics_engine.physics_types import Ball, Surface, Point, SurfaceType, maybe_njit
 
 from dataclasses import dataclass
 
@@ -19,6 +19,24 @@ class _Constants:
     SIDEWARD_PUSH_ACCELERATION = 2100
 
 
+# Tolerance for treating a denominator as zero (parallel ray and surface).
+_EPS = 1e-9
+
+@maybe_njit
+def _raycast_kernel(x1: float, y1: float,
+                    x2: float, y2: float,
+                    x3: float, y3: float,
+                    x4: float, y4: float) -> tuple[float, float]:
+    '''Pure-float raycast math, kept at module level so numba can compile it.'''
+    denom = (x1 - x2)*(y3 - y4) - (y1 - y2)*(x3 - x4)
+    if -_EPS < denom < _EPS:
+        return (math.inf, math.inf)
+
+    t: float = ((x1 - x3)*(y3 - y4) - (y1 - y3)*(x3 - x4)) / denom
+    u: float = -((x1 - x2)*(y1 - y3) - (y1 - y2)*(x1 - x3)) / denom
+    return (t, u)
+
+
 class PhysicsModel:
     def __init__(self, fps: int, width: int, height: int):
         self._gravity = _Constants.GRAVITY / fps**2
@@ -37,8 +55,20 @@ class PhysicsModel:
         self._width = width
         self._height = height
         self._fps = fps
+        self._push_accel = _Constants.SIDEWARD_PUSH_ACCELERATION / fps**2
+        self._speed_limit = _Constants.SPEED_LIMIT_X / fps
+        self._dist_coeffs = [self._dist_coeff(surface) for surface in self._surfaces]
         self._init_ball()
 
+    @staticmethod
+    def _dist_coeff(surface: Surface) -> tuple[float, float, float, float]:
+        '''Normalized line coefficients for the point-to-surface distance.
+        Surfaces never move, so these are computed once instead of per frame.'''
+        x1, y1, x2, y2 = surface.coords
+        length = ((y2 - y1)**2 + (x2 - x1)**2) ** 0.5
+        sign = surface.surface_type.value
+        return ((y2 - y1) / length, (x2 - x1) / length, ((x2*y1) - (y2*x1)) / length, sign)
+
     @property
     def surfaces(self):
         return self._surfaces
@@ -54,24 +84,10 @@ class PhysicsModel:
     @property
     def ball_dist_from_every_surface(self):
         distances: list[float] = []
-        for surface in self._surfaces:
-            x1, x2, y1, y2 = surface.start.p_x, surface.end.p_x, surface.start.p_y, surface.end.p_y
-            x3, y3 = self._ball.p_x, self._ball.p_y
-            
-            determinant: float = (y2 - y1)*x3 - (x2 - x1)*y3 + ((x2*y1) - (y2*x1))
-            length: float = ((y2 - y1)**2 + (x2 - x1)**2) ** 0.5
-            
-            match surface.surface_type:
-                case SurfaceType.IN:
-                    dist = -determinant / length
-            
-                case SurfaceType.OUT:
-                    dist = determinant / length
-
-                case SurfaceType.DOUBLE:
-                    dist = abs(determinant / length)
-       
-            distances.append(dist)
+        x3, y3 = self._ball.p_x, self._ball.p_y
+        for a, b, c, sign in self._dist_coeffs:
+            determinant: float = a*x3 - b*y3 + c
+            distances.append(sign * determinant if sign else abs(determinant))
 
         return distances
 
@@ -84,86 +100,94 @@ class PhysicsModel:
 
     @property
     def closest_surface(self) -> Surface:
-        dist = self.ball_dist_from_next_surface
-        distances = self.ball_dist_from_every_surface
-        return self._surfaces[distances.index(dist)]
+        # Single pass over the precomputed coefficients, tracking the
+        # running minimum instead of building a distance list and then
+        # re-scanning it with min() and index().
+        x3, y3 = self._ball.p_x, self._ball.p_y
+        best_index = 0
+        best_distance = math.inf
+        for index, (a, b, c, sign) in enumerate(self._dist_coeffs):
+            determinant = a*x3 - b*y3 + c
+            distance = sign * determinant if sign else abs(determinant)
+            if distance < best_distance:
+                best_distance = distance
+                best_index = index
+        return self._surfaces[best_index]
 
 
     def _surface_details(self) -> tuple[float, float, float, float]:
-        x1, x2, y1, y2 = (
-            self.closest_surface.start.p_x, 
-            self.closest_surface.end.p_x, 
-            self.closest_surface.start.p_y, 
-            self.closest_surface.end.p_y)
-        
-        return x1, y1, x2, y2
+        return self.closest_surface.coords
     
     @staticmethod
     def unit_vector(a: float):
-        dir_x, dir_y = (
-            math.cos(math.radians(a)),
-            -math.sin(math.radians(a))
-        )
-        return dir_x, dir_y
+        rad = math.radians(a)
+        return math.cos(rad), -math.sin(rad)
     
-    def ray_intersection(self):
+    def ray_intersection(self) -> tuple[float, float]:
         dir_x, dir_y = self.unit_vector(self._ball.v_d)
-        
+
         x3, y3 = self._ball.p_x, self._ball.p_y
         x4, y4 = self._ball.p_x + dir_x, self._ball.p_y + dir_y
 
-        t, u = self.raycast(*self._surface_details(), x3, y3, x4, y4)
-        intersection = (x3 + u * dir_x, y3 + u * dir_y)
-        
-        del(t)
-        print(intersection)
+        _, u = self.raycast(*self._surface_details(), x3, y3, x4, y4)
+        return (x3 + u * dir_x, y3 + u * dir_y)
 
     @staticmethod
-    def raycast(x1: float, y1: float, 
-                x2: float, y2: float, 
-                x3: float, y3: float, 
+    def raycast(x1: float, y1: float,
+                x2: float, y2: float,
+                x3: float, y3: float,
                 x4: float, y4: float) -> tuple[float, float]:
-        
-        denom = (x1 - x2)*(y3 - y4) - (y1 - y2)*(x3 - x4)
-        if denom == 0:
-            return (float('inf'), float('inf'))
-        
-        else:
-            t: float = ((x1 - x3)*(y3 - y4) - (y1 - y3)*(x3 - x4)) / denom
-            u: float = -((x1 - x2)*(y1 - y3) - (y1 - y2)*(x1 - x3)) / denom
-            print(t, u)
-            return (t, u)
+        return _raycast_kernel(x1, y1, x2, y2, x3, y3, x4, y4)
     
 
+    @staticmethod
+    def segments_straddle(x1: float, y1: float,
+                          x2: float, y2: float,
+                          x3: float, y3: float,
+                          x4: float, y4: float) -> bool:
+        '''Division-free necessary condition for two segments to intersect:
+        each segment's endpoints must lie on opposite sides of the other's line.'''
+        fa1 = (x4 - x3)*(y1 - y3) - (y4 - y3)*(x1 - x3)
+        fa2 = (x4 - x3)*(y2 - y3) - (y4 - y3)*(x2 - x3)
+        fb1 = (x2 - x1)*(y3 - y1) - (y2 - y1)*(x3 - x1)
+        fb2 = (x2 - x1)*(y4 - y1) - (y2 - y1)*(x4 - x1)
+        return fa1 * fa2 <= 0 and fb1 * fb2 <= 0
+
     def check_bounce(self):
         # Check if the ball is going to bounce off the surface
+        x3, y3 = self._ball.p_x, self._ball.p_y
+        x4, y4 = x3 + self._ball.v_x, y3 + self._ball.v_y
+
+        surface = self.closest_surface
+
+        # Broad phase: the motion segment's box must overlap the surface's box.
+        x_min, y_min, x_max, y_max = surface.bounds
+        if (min(x3, x4) > x_max or max(x3, x4) < x_min
+                or min(y3, y4) > y_max or max(y3, y4) < y_min):
+            return
+
+        # Cheap sign-product reject on the ball's motion segment before
+        # paying for the raycast divisions.
+        details = surface.coords
+        if not self.segments_straddle(*details, x3, y3, x4, y4):
+            return
+
         dir_x, dir_y = self.unit_vector(self._ball.v_d)
 
-        x3, y3 = self._ball.p_x, self._ball.p_y
-        x4, y4 = self._ball.p_x + dir_x, self._ball.p_y + dir_y
-        
-        t, u = self.raycast(*self._surface_details(), x3, y3, x4, y4)
-        if t == float('inf') or u == float('inf'):
-            pass
-        else:
-            max_distance = self._ball.v_m
-            epsilon = 1e-2
-            if epsilon <= t <= 1 - epsilon and 0 <= u <= max_distance:
-                self.bounce()
-            else:
-                pass
+        t, u = self.raycast(*details, x3, y3, x3 + dir_x, y3 + dir_y)
+        # An inf t/u from a parallel pair fails the range check on its own.
+        epsilon = 1e-2
+        if epsilon <= t <= 1 - epsilon and 0 <= u <= self._ball.v_m:
+            self.bounce()
 
     def bounce(self):
         # The ball is going to bounce
         # Get the normal vector of the surface
-        x1, x2, y1, y2 = self.closest_surface.start.p_x, self.closest_surface.end.p_x, self.closest_surface.start.p_y, self.closest_surface.end.p_y
-        
-        # Calculate the normal vector
-        dx = x2 - x1
-        dy = y2 - y1
-        length = (dx**2 + dy**2) ** 0.5
-        nx = -dy / length
-        ny = dx / length
+        surface = self.closest_surface
+
+        # The surface's unit normal is normalized once and cached on the
+        # Line, so repeat bounces skip the division entirely.
+        nx, ny = surface.normal
 
         # Calculate the dot product of the velocity and the normal vector
         dot_product = (self._ball.v_x * nx + self._ball.v_y * ny)
@@ -189,22 +213,17 @@ class PhysicsModel:
         
     def height_update(self):
         self.check_bounce()
-        self._accelerate_x()
-        self._accelerate_y()
-        self._move_x()
-        self._move_y()
-
-    def _move_x(self):
-        self._ball.p_x += self._ball.v_x
-
-    def _move_y(self):
-        self._ball.p_y += self._ball.v_y
-
-    def _accelerate_x(self):
-        self._ball.v_x += self._ball.a_x
-    
-    def _accelerate_y(self):
-        self._ball.v_y += self._ball.a_y
+        self._integrate()
+
+    def _integrate(self):
+        '''One fused kinematics step: velocity then position, both axes.
+        Replaces the four per-axis methods so the frame update is a
+        single call with one ball lookup instead of eight.'''
+        ball = self._ball
+        ball.v_x += ball.a_x
+        ball.v_y += ball.a_y
+        ball.p_x += ball.v_x
+        ball.p_y += ball.v_y
 
     def _accelerate_m(self):
         self._ball.v_m += self._ball.a_m
@@ -216,18 +235,25 @@ class PhysicsModel:
     def jump(self):
         self._ball.v_y = -_Constants.JUMP_HEIGHT/self._fps
 
+    def push(self, d_x: int, d_y: int):
+        '''Applies directional push input in one call. d_x/d_y are -1, 0
+        or 1 per axis (e.g. right minus left); each axis accelerates
+        only while its speed in that direction is under the limit, same
+        as the individual push_* methods.'''
+        ball = self._ball
+        if d_x and ball.v_x * d_x < self._speed_limit:
+            ball.v_x += d_x * self._push_accel
+        if d_y and ball.v_y * d_y < self._speed_limit:
+            ball.v_y += d_y * self._push_accel
+
     def push_right(self):
-        if self._ball.v_x < _Constants.SPEED_LIMIT_X/self._fps:
-            self._ball.v_x += _Constants.SIDEWARD_PUSH_ACCELERATION/(self._fps**2)
+        self.push(1, 0)
 
     def push_left(self):
-        if self._ball.v_x > -_Constants.SPEED_LIMIT_X/self._fps:
-            self._ball.v_x -= _Constants.SIDEWARD_PUSH_ACCELERATION/(self._fps**2)
+        self.push(-1, 0)
 
     def push_down(self):
-        if self._ball.v_y < _Constants.SPEED_LIMIT_X/self._fps:
-            self._ball.v_y += _Constants.SIDEWARD_PUSH_ACCELERATION/(self._fps**2)
+        self.push(0, 1)
 
     def push_up(self):
-        if self._ball.v_y > -_Constants.SPEED_LIMIT_X/self._fps:
-            self._ball.v_y -=_Constants.SIDEWARD_PUSH_ACCELERATION/(self._fps**2)
+        self.push(0, -1)
@@ -0,0 +1,350 @@
+'''Bulk-simulation helpers backed by NumPy.
+
+Optional companion to physics_types for simulating many balls at once:
+instead of one Python object per ball, state lives in parallel arrays
+(structure-of-arrays) so a whole frame's integration is a handful of
+vectorized operations. Requires numpy, like tester.py requires pyxel.'''
+
+try:
+    from physics_types import Ball
+except ImportError:
+    from physics_engine.physics_types import Ball
+
+import numpy as np
+
+import os
+
+try:
+    from numba import njit as _numba_njit, prange as _prange
+except ImportError:
+    _numba_njit = None
+
+# Honour the same switch as physics_types: PHYSICS_BACKEND=py keeps the
+# batch helpers on plain NumPy and skips the numba warm-up.
+if os.environ.get('PHYSICS_BACKEND', '').lower() == 'py':
+    _numba_njit = None
+
+# Tolerance for treating a denominator as zero, matching physics._EPS.
+_EPS = 1e-9
+
+
+if _numba_njit is not None:
+    @_numba_njit(cache=True, fastmath=True, parallel=True)
+    def _integrate(p_x, p_y, v_x, v_y, a_x, a_y, dt):
+        """Fused semi-implicit Euler step over every ball in parallel."""
+        for i in _prange(p_x.shape[0]):
+            v_x[i] += a_x[i] * dt
+            v_y[i] += a_y[i] * dt
+            p_x[i] += v_x[i] * dt
+            p_y[i] += v_y[i] * dt
+else:
+    _integrate = None
+
+
+def intersect_many(segs_a, segs_b) -> tuple[np.ndarray, np.ndarray]:
+    """Batched version of PhysicsModel.raycast for N x M segment pairs.
+
+    Both arguments are float arrays of shape (N, 4) and (M, 4) whose rows
+    hold (x1, y1, x2, y2). Returns (t, u) arrays of shape (N, M) with the
+    same meaning as raycast's return value; parallel pairs get inf."""
+    a = np.asarray(segs_a, dtype=float)
+    b = np.asarray(segs_b, dtype=float)
+    x1, y1, x2, y2 = (a[:, i, None] for i in range(4))
+    x3, y3, x4, y4 = (b[None, :, i] for i in range(4))
+
+    denom = (x1 - x2)*(y3 - y4) - (y1 - y2)*(x3 - x4)
+    parallel = np.abs(denom) < _EPS
+    denom = np.where(parallel, 1.0, denom)
+
+    t = ((x1 - x3)*(y3 - y4) - (y1 - y3)*(x3 - x4)) / denom
+    u = -((x1 - x2)*(y1 - y3) - (y1 - y2)*(x1 - x3)) / denom
+    return np.where(parallel, np.inf, t), np.where(parallel, np.inf, u)
+
+
+# Unit-circle sample tables keyed by edge count, built on first use and
+# shared by every circle sampled at that resolution.
+_CIRCLE_TABLES: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+
+def circle_edge_arrays(circle, num_edges: int = 36) -> tuple[np.ndarray, np.ndarray]:
+    """Samples a circle's polygonal outline as (start_xy, end_xy) arrays.
+
+    The numeric counterpart of Circle.edges for collision kernels that
+    would otherwise immediately unpack the Line objects back into
+    coordinates; no Point or Line instances are built. num_edges trades
+    accuracy for work — coarse broad-phase checks can drop to 16 where
+    the default 36 is overkill."""
+    if num_edges < 3:
+        raise ValueError("A circle approximation needs at least 3 edges.")
+    tables = _CIRCLE_TABLES.get(num_edges)
+    if tables is None:
+        angles = np.linspace(0.0, 2.0 * np.pi, num_edges + 1)
+        tables = _CIRCLE_TABLES[num_edges] = (np.cos(angles), np.sin(angles))
+    cos_table, sin_table = tables
+    xs = circle._p_x + circle._r * cos_table
+    ys = circle._p_y + circle._r * sin_table
+    return np.column_stack((xs[:-1], ys[:-1])), np.column_stack((xs[1:], ys[1:]))
+
+
+def stack_surfaces(surfaces) -> tuple[np.ndarray, np.ndarray]:
+    """Packs surface (or any Line) endpoints into (start_xy, end_xy)
+    float arrays of shape (M, 2), the layout the batched collision
+    kernels below consume. Surfaces never move, so a world can build
+    these once and reuse them every frame."""
+    coords = np.array([surface.coords for surface in surfaces], dtype=float)
+    return np.ascontiguousarray(coords[:, :2]), np.ascontiguousarray(coords[:, 2:])
+
+
+def surface_dist_coeffs(surfaces) -> np.ndarray:
+    """Normalized distance coefficients for M surfaces as an (M, 4) array.
+
+    Batched counterpart of PhysicsModel._dist_coeff: each row holds
+    (a, b, c, sign) with the line coefficients scaled by length and the
+    sign taken from the surface type. Surfaces never move, so a world
+    computes this once and feeds it to ball_surface_distances each
+    frame."""
+    coords = np.array([surface.coords for surface in surfaces], dtype=float)
+    x1, y1, x2, y2 = coords.T
+    length = np.hypot(x2 - x1, y2 - y1)
+    signs = np.array([surface.surface_type.value for surface in surfaces], dtype=float)
+    return np.column_stack(((y2 - y1) / length, (x2 - x1) / length,
+                            (x2 * y1 - y2 * x1) / length, signs))
+
+
+def ball_surface_distances(p_x, p_y, coeffs: np.ndarray) -> np.ndarray:
+    """Distances from N balls to M surfaces as one (N, M) broadcast.
+
+    Matches PhysicsModel.ball_dist_from_every_surface per row: the
+    signed determinant against each surface's coefficients, with
+    DOUBLE-sided surfaces (sign 0) taking the absolute value."""
+    p_x = np.atleast_1d(np.asarray(p_x, dtype=float))
+    p_y = np.atleast_1d(np.asarray(p_y, dtype=float))
+    a, b, c, sign = coeffs.T
+    determinant = p_x[:, None] * a - p_y[:, None] * b + c
+    return np.where(sign == 0.0, np.abs(determinant), sign * determinant)
+
+
+def closest_surface_indices(p_x, p_y, coeffs: np.ndarray) -> np.ndarray:
+    """Index of the closest surface for each of N balls, via one argmin
+    over the broadcasted distance matrix."""
+    return ball_surface_distances(p_x, p_y, coeffs).argmin(axis=1)
+
+
+def closest_point_on_segments(points, seg_start, seg_end) -> np.ndarray:
+    """Closest point on each of M segments to each of N query points.
+
+    points is (N, 2); seg_start/seg_end are (M, 2) as produced by
+    stack_surfaces. Returns an (N, M, 2) array: the projection of each
+    point onto each segment, clamped to the segment's endpoints. All
+    N x M projections run as broadcasted array ops instead of nested
+    Python loops."""
+    p = np.atleast_2d(np.asarray(points, dtype=float))
+    a = np.asarray(seg_start, dtype=float)
+    b = np.asarray(seg_end, dtype=float)
+
+    ab = b - a
+    squared = (ab * ab).sum(axis=-1)
+    # Degenerate (point) segments get a dummy denominator; t clamps to 0
+    # and the result is the segment's single endpoint either way.
+    squared = np.where(squared < _EPS, 1.0, squared)
+    t = ((p[:, None, :] - a[None, :, :]) * ab[None, :, :]).sum(axis=-1) / squared
+    np.clip(t, 0.0, 1.0, out=t)
+    return a[None, :, :] + t[..., None] * ab[None, :, :]
+
+
+class BallView:
+    """A lightweight view of one ball inside a BallArray.
+
+    Reads and writes go straight to the owning array's columns, so a
+    view can stand in for a Ball in per-object code without copying the
+    state out of the SoA layout."""
+    __slots__ = ('_soa', '_index')
+
+    def __init__(self, soa: 'BallArray', index: int):
+        self._soa = soa
+        self._index = index
+
+    def __repr__(self):
+        return (f"BallView(x={self.p_x}, y={self.p_y}, v_x={self.v_x}, v_y={self.v_y}, "
+                f"a_x={self.a_x}, a_y={self.a_y}, radius={self.r})")
+
+    @property
+    def p_x(self) -> float:
+        return float(self._soa.p_x[self._index])
+
+    @p_x.setter
+    def p_x(self, value: float):
+        self._soa.p_x[self._index] = value
+
+    @property
+    def p_y(self) -> float:
+        return float(self._soa.p_y[self._index])
+
+    @p_y.setter
+    def p_y(self, value: float):
+        self._soa.p_y[self._index] = value
+
+    @property
+    def v_x(self) -> float:
+        return float(self._soa.v_x[self._index])
+
+    @v_x.setter
+    def v_x(self, value: float):
+        self._soa.v_x[self._index] = value
+
+    @property
+    def v_y(self) -> float:
+        return float(self._soa.v_y[self._index])
+
+    @v_y.setter
+    def v_y(self, value: float):
+        self._soa.v_y[self._index] = value
+
+    @property
+    def a_x(self) -> float:
+        return float(self._soa.a_x[self._index])
+
+    @a_x.setter
+    def a_x(self, value: float):
+        self._soa.a_x[self._index] = value
+
+    @property
+    def a_y(self) -> float:
+        return float(self._soa.a_y[self._index])
+
+    @a_y.setter
+    def a_y(self, value: float):
+        self._soa.a_y[self._index] = value
+
+    @property
+    def r(self) -> float:
+        return float(self._soa.r[self._index])
+
+    @r.setter
+    def r(self, value: float):
+        if value <= 0:
+            raise ValueError("Radius must be positive.")
+        self._soa.r[self._index] = value
+
+    def to_ball(self) -> Ball:
+        """Copies this view out into a standalone Ball object."""
+        return Ball(p_x=self.p_x, p_y=self.p_y, v_x=self.v_x, v_y=self.v_y,
+                    a_x=self.a_x, a_y=self.a_y, r=self.r)
+
+
+class BallArray:
+    """Structure-of-arrays container for the state of many balls.
+
+    Positions, velocities and accelerations are stored as parallel
+    arrays, so step() integrates every ball with four array adds instead
+    of a Python loop over objects. State defaults to float64; pass
+    dtype=np.float32 to halve the memory traffic when pixel-level
+    precision is enough (coordinates here are screen coordinates)."""
+    __slots__ = ('_data', 'p_x', 'p_y', 'v_x', 'v_y', 'a_x', 'a_y', 'r',
+                 'px_i16', 'py_i16', 'r_i16', '_render_tmp')
+
+    def __init__(self, n: int, r: float = 1.0, dtype=np.float64):
+        if n < 0:
+            raise ValueError("Ball count must be non-negative.")
+        # One contiguous (7, n) block holds the whole float state; the
+        # named columns are row views into it, so per-field access works
+        # as before while the full state can be copied, saved or handed
+        # to a kernel as a single aligned buffer.
+        self._data = np.zeros((7, n), dtype=dtype)
+        self.p_x, self.p_y, self.v_x, self.v_y, self.a_x, self.a_y, self.r = self._data
+        self.r[:] = r
+        # Parallel int16 copies for the render/broad-phase path: pyxel
+        # rounds to whole pixels anyway, and int16 rows move a quarter
+        # of the memory of the float64 physics state.
+        self.px_i16 = np.zeros(n, dtype=np.int16)
+        self.py_i16 = np.zeros(n, dtype=np.int16)
+        self.r_i16 = np.rint(self.r).astype(np.int16)
+        self._render_tmp = np.empty(n, dtype=dtype)
+
+    @classmethod
+    def from_bearing(cls, p_x, p_y, v_m, v_d, a_m=0.0, a_d=0.0, r: float = 1.0) -> 'BallArray':
+        """Batched Ball.from_bearing: builds N balls from arrays of polar
+        velocities/accelerations with one vectorized cos/sin per angle
+        array instead of per-ball trig calls. Angles are in degrees,
+        measured counter-clockwise in screen coordinates like Ball's."""
+        p_x = np.atleast_1d(np.asarray(p_x, dtype=float))
+        soa = cls(len(p_x))
+        soa.p_x[:] = p_x
+        soa.p_y[:] = p_y
+        v_rad = np.radians(v_d)
+        a_rad = np.radians(a_d)
+        soa.v_x[:] = v_m * np.cos(v_rad)
+        soa.v_y[:] = -(v_m * np.sin(v_rad))
+        soa.a_x[:] = a_m * np.cos(a_rad)
+        soa.a_y[:] = -(a_m * np.sin(a_rad))
+        soa.r[:] = r
+        return soa
+
+    @classmethod
+    def from_balls(cls, balls) -> 'BallArray':
+        """Packs existing Ball objects into a new BallArray."""
+        soa = cls(len(balls))
+        for i, ball in enumerate(balls):
+            soa.p_x[i] = ball.p_x
+            soa.p_y[i] = ball.p_y
+            soa.v_x[i] = ball.v_x
+            soa.v_y[i] = ball.v_y
+            soa.a_x[i] = ball.a_x
+            soa.a_y[i] = ball.a_y
+            soa.r[i] = ball.r
+        return soa
+
+    def to_balls(self) -> list[Ball]:
+        """Materializes standalone Ball objects from the current state."""
+        return [
+            Ball(p_x=float(self.p_x[i]), p_y=float(self.p_y[i]),
+                 v_x=float(self.v_x[i]), v_y=float(self.v_y[i]),
+                 a_x=float(self.a_x[i]), a_y=float(self.a_y[i]),
+                 r=float(self.r[i]))
+            for i in range(len(self))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.p_x)
+
+    def __getitem__(self, index: int) -> BallView:
+        if not -len(self) <= index < len(self):
+            raise IndexError("Ball index out of range.")
+        return BallView(self, index % len(self))
+
+    def sync_render(self):
+        """Refreshes the int16 pixel coordinates from the float state.
+
+        Called once per frame after step(); rounding goes through a
+        reused scratch buffer so the conversion allocates nothing."""
+        np.rint(self.p_x, out=self._render_tmp)
+        self.px_i16[:] = self._render_tmp
+        np.rint(self.p_y, out=self._render_tmp)
+        self.py_i16[:] = self._render_tmp
+        np.rint(self.r, out=self._render_tmp)
+        self.r_i16[:] = self._render_tmp
+
+    def v_d(self) -> np.ndarray:
+        """Velocity bearings in degrees for every ball in one shot.
+
+        Same convention as Ball.v_d (counter-clockwise in screen
+        coordinates, normalized to [0, 360)), but one vectorized arctan2
+        replaces N scalar atan2 calls."""
+        return np.degrees(np.arctan2(-self.v_y, self.v_x)) % 360.0
+
+    def a_d(self) -> np.ndarray:
+        """Acceleration bearings in degrees; see v_d."""
+        return np.degrees(np.arctan2(-self.a_y, self.a_x)) % 360.0
+
+    def step(self, dt: float = 1.0):
+        """Advance every ball by one time step (velocity then position).
+
+        With numba installed the four updates fuse into one compiled
+        parallel loop; otherwise they run as plain array adds."""
+        if _integrate is not None:
+            _integrate(self.p_x, self.p_y, self.v_x, self.v_y, self.a_x, self.a_y, dt)
+            return
+        self.v_x += self.a_x * dt
+        self.v_y += self.a_y * dt
+        self.p_x += self.v_x * dt
+        self.p_y += self.v_y * dt
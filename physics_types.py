@@ -1,7 +1,68 @@
 from __future__ import annotations
-from enum import Enum, auto
+from enum import Enum
 from abc import ABC, abstractmethod
 import math
+import os
+
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:
+    _numba_njit = None
+
+# PHYSICS_BACKEND=py forces the pure-Python kernels even when numba is
+# installed, so short scripts that only build a few shapes can skip the
+# JIT warm-up cost.
+if os.environ.get('PHYSICS_BACKEND', '').lower() == 'py':
+    _numba_njit = None
+
+
+def maybe_njit(func):
+    """Compile a pure-float function with numba when it is installed;
+    otherwise return the function unchanged."""
+    if _numba_njit is None:
+        return func
+    return _numba_njit(cache=True, fastmath=True)(func)
+
+
+@maybe_njit
+def _poly_area(xs: tuple[float, ...], ys: tuple[float, ...]) -> float:
+    """Shoelace area over flat coordinate tuples; single fused pass."""
+    area = 0.0
+    x_prev, y_prev = xs[-1], ys[-1]
+    for i in range(len(xs)):
+        x, y = xs[i], ys[i]
+        area += x_prev * y - x * y_prev
+        x_prev, y_prev = x, y
+    return abs(area) / 2.0
+
+
+@maybe_njit
+def _poly_perimeter(xs: tuple[float, ...], ys: tuple[float, ...]) -> float:
+    """Edge-length sum over flat coordinate tuples; single fused pass."""
+    perimeter = 0.0
+    x_prev, y_prev = xs[-1], ys[-1]
+    for i in range(len(xs)):
+        x, y = xs[i], ys[i]
+        dx = x - x_prev
+        dy = y - y_prev
+        perimeter += math.sqrt(dx*dx + dy*dy)
+        x_prev, y_prev = x, y
+    return perimeter
+
+
+# Unit-circle samples for the polygonal approximation in Circle.edges,
+# computed once at import instead of 72 trig calls per edges access.
+_CIRCLE_EDGE_COUNT = 36
+_CIRCLE_COS = tuple(math.cos(2 * math.pi * i / _CIRCLE_EDGE_COUNT) for i in range(_CIRCLE_EDGE_COUNT + 1))
+_CIRCLE_SIN = tuple(math.sin(2 * math.pi * i / _CIRCLE_EDGE_COUNT) for i in range(_CIRCLE_EDGE_COUNT + 1))
+
+
+def _hypot2(x: float, y: float) -> float:
+    """Unscaled Euclidean norm for the per-frame hot path. math.hypot
+    pays for overflow-safe rescaling that window-bounded coordinates
+    never need; a raw sqrt of the squares is markedly cheaper."""
+    return math.sqrt(x*x + y*y)
 
 
 def rad_to_deg(radians: float) -> float:
@@ -14,16 +75,30 @@ def deg_to_rad(degrees: float) -> float:
 
 class Shape(ABC):
     """Abstract base class for all shapes."""
+    __slots__ = ()
+
     def __repr__(self):
         return f"{self.__class__.__name__}()"
-    
+
+    def _hash_key(self) -> tuple:
+        """The tuple of identity values behind __eq__ and __hash__.
+        Caches stay excluded so they never affect identity."""
+        raise NotImplementedError
+
     def __eq__(self, value: object) -> bool:
-        if not isinstance(value, Shape):
-            return False
-        return self.__dict__ == value.__dict__
-    
+        if type(value) is not type(self):
+            return NotImplemented
+        return self._hash_key() == value._hash_key()
+
     def __hash__(self) -> int:
-        return hash(tuple(sorted(self.__dict__.items())))
+        """Hash of the identity key, computed once per instance.
+
+        Shapes used as dict/set keys are treated as immutable: mutating
+        one after it has been hashed (e.g. moving a Ball) leaves the
+        cached value stale, as with any hashable mutable object."""
+        if self._hash is None:
+            self._hash = hash(self._hash_key())
+        return self._hash
 
 
     @property
@@ -52,149 +127,297 @@ class Shape(ABC):
 
 
 class Point:
+    __slots__ = ('p_x', 'p_y')
+
     def __init__(self, p_x: float, p_y: float):
-        self.p_x = p_x
-        self.p_y = p_y
+        self.p_x = float(p_x)
+        self.p_y = float(p_y)
+
+    @classmethod
+    def _make(cls, p_x: float, p_y: float) -> Point:
+        """Fast constructor for coordinates that are already floats;
+        skips __init__ and its coercion."""
+        point = object.__new__(cls)
+        point.p_x = p_x
+        point.p_y = p_y
+        return point
 
     def __repr__(self):
         return f"Point({self.p_x}, {self.p_y})"
 
+    def __eq__(self, other: object) -> bool:
+        """Tolerant equality: identity and exact compares come first as
+        fast paths, then math.isclose absorbs the rounding drift that
+        float arithmetic leaves on computed coordinates."""
+        if self is other:
+            return True
+        if not isinstance(other, Point):
+            return NotImplemented
+        if self.p_x == other.p_x and self.p_y == other.p_y:
+            return True
+        return math.isclose(self.p_x, other.p_x) and math.isclose(self.p_y, other.p_y)
+
+    def __hash__(self) -> int:
+        # Hashing stays exact: only points with identical coordinates
+        # are reliable dict/set keys, merely-close ones may not collide.
+        return hash((self.p_x, self.p_y))
+
     def __sub__(self, other: Point) -> Point:
-        return Point(self.p_x - other.p_x, self.p_y - other.p_y)
+        return Point._make(self.p_x - other.p_x, self.p_y - other.p_y)
 
     def __add__(self, other: Point) -> Point:
-        return Point(self.p_x + other.p_x, self.p_y + other.p_y)
+        return Point._make(self.p_x + other.p_x, self.p_y + other.p_y)
 
     def __mul__(self, scalar: float):
-        return Point(self.p_x * scalar, self.p_y * scalar)
+        return Point._make(self.p_x * scalar, self.p_y * scalar)
 
     def __truediv__(self, scalar: float):
-        return Point(self.p_x / scalar, self.p_y / scalar)
+        return Point._make(self.p_x / scalar, self.p_y / scalar)
+
+    def translate(self, d_x: float, d_y: float) -> None:
+        """Moves the point in place. Integration paths that step a point
+        every frame can use this instead of __add__, which allocates a
+        fresh Point per call."""
+        self.p_x += d_x
+        self.p_y += d_y
 
 
 class Line:
+    __slots__ = ('start', 'end', '_dx', '_dy', '_length', '_slope', '_angle', '_normal', '_bounds', '_coords')
+
     def __init__(self, start: Point, end: Point):
         self.start = start
         self.end = end
+        # The deltas feed length, slope and angle alike; compute them once
+        # here instead of re-subtracting endpoints in every property.
+        self._dx: float = end.p_x - start.p_x
+        self._dy: float = end.p_y - start.p_y
+        self._length: float | None = None
+        self._slope: float | None = None
+        self._angle: float | None = None
+        self._normal: tuple[float, float] | None = None
+        self._bounds: tuple[float, float, float, float] | None = None
+        self._coords: tuple[float, float, float, float] | None = None
 
     def __repr__(self):
         return f"{type(self).__name__}({self.start}, {self.end})"
 
     @property
     def length(self) -> float:
-        """Returns the length of the line"""
-        return ((self.end.p_x - self.start.p_x) ** 2 + (self.end.p_y - self.start.p_y) ** 2) ** 0.5
+        """Returns the length of the line. Endpoints never change after
+        construction, so the value is computed once and cached."""
+        if self._length is None:
+            self._length = math.hypot(self._dx, self._dy)
+        return self._length
 
     @property
     def slope(self) -> float:
-        """Returns the slope of the line"""
-        if self.end.p_x - self.start.p_x == 0:
-            return float('inf')  if self.end.p_y > self.start.p_y else float('-inf')
-        return (self.end.p_y - self.start.p_y) / (self.end.p_x - self.start.p_x)
-    
+        """Returns the slope of the line. Cached on first access like
+        length; vertical lines get a signed infinity."""
+        if self._slope is None:
+            if self._dx == 0:
+                self._slope = math.copysign(math.inf, self._dy)
+            else:
+                self._slope = self._dy / self._dx
+        return self._slope
+
     @property
     def angle(self) -> float:
-        """Returns the angle of the line against the positive x-axis"""
-        if self.end.p_x - self.start.p_x == 0:
-            return math.degrees(math.pi / 2) if self.end.p_y > self.start.p_y else math.degrees(3*math.pi / 2)
-        raw_deg: float = math.degrees(math.atan2(self.end.p_y - self.start.p_y, self.end.p_x - self.start.p_x))
-        return raw_deg + 360 if raw_deg < 0 else raw_deg
-    
+        """Returns the angle of the line against the positive x-axis.
+        Cached on first access like length."""
+        if self._angle is None:
+            # atan2 covers the vertical case, and % 360.0 on a float is
+            # already non-negative, so no sign branches are needed.
+            self._angle = math.degrees(math.atan2(self._dy, self._dx)) % 360.0
+        return self._angle
+    
+    @property
+    def normal(self) -> tuple[float, float]:
+        """Returns the unit normal of the line as raw floats (n_x, n_y),
+        normalized once with the cached length and then reused; no
+        object is allocated per query."""
+        if self._normal is None:
+            inv_length = 1.0 / self.length
+            self._normal = (-self._dy * inv_length, self._dx * inv_length)
+        return self._normal
+
+    def signed_distance(self, p_x: float, p_y: float) -> float:
+        """Signed distance from a point to the line's infinite extension,
+        the core ball-vs-surface projection: the offset from start dotted
+        with the cached unit normal. Two subtractions, two multiplies and
+        an add per query."""
+        n_x, n_y = self.normal
+        return (p_x - self.start.p_x) * n_x + (p_y - self.start.p_y) * n_y
+
     @property
     def midpoint(self) -> Point:
         """Returns the midpoint of the line"""
-        return Point((self.start.p_x + self.end.p_x) / 2, (self.start.p_y + self.end.p_y) / 2)
-    
+        return Point._make((self.start.p_x + self.end.p_x) / 2, (self.start.p_y + self.end.p_y) / 2)
+
+    @property
+    def coords(self) -> tuple[float, float, float, float]:
+        """Returns the endpoints as raw floats (x1, y1, x2, y2),
+        so coordinate-level math can skip the Point attribute chains.
+        Computed once and cached like length."""
+        if self._coords is None:
+            self._coords = (self.start.p_x, self.start.p_y, self.end.p_x, self.end.p_y)
+        return self._coords
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Returns the bounding box of the line as (x_min, y_min, x_max, y_max),
+        computed once and cached like length."""
+        if self._bounds is None:
+            x1, x2 = self.start.p_x, self.end.p_x
+            y1, y2 = self.start.p_y, self.end.p_y
+            self._bounds = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        return self._bounds
+
+    def overlaps(self, other: Line) -> bool:
+        """Checks whether the bounding boxes of two lines overlap.
+        Cheap broad-phase test before any exact intersection math."""
+        a_x_min, a_y_min, a_x_max, a_y_max = self.bounds
+        b_x_min, b_y_min, b_x_max, b_y_max = other.bounds
+        return a_x_min <= b_x_max and b_x_min <= a_x_max and a_y_min <= b_y_max and b_y_min <= a_y_max
+
+class LineIndex:
+    """Uniform-grid spatial index over a fixed set of lines.
+
+    Buckets each line's bounding box into grid cells so broad-phase
+    queries only look at lines sharing a cell with the probe, instead of
+    scanning every line. Intended for all-pairs or one-vs-many
+    intersection queries over many surfaces."""
+    __slots__ = ('_lines', '_cell_size', '_cells')
+
+    def __init__(self, lines: tuple[Line, ...] | list[Line], cell_size: float = 64.0):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive.")
+        self._lines: tuple[Line, ...] = tuple(lines)
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        for index, line in enumerate(self._lines):
+            for cell in self._overlapping_cells(line.bounds):
+                self._cells.setdefault(cell, []).append(index)
+
+    def _overlapping_cells(self, bounds: tuple[float, float, float, float]):
+        x_min, y_min, x_max, y_max = bounds
+        size = self._cell_size
+        for cell_x in range(int(x_min // size), int(x_max // size) + 1):
+            for cell_y in range(int(y_min // size), int(y_max // size) + 1):
+                yield (cell_x, cell_y)
+
+    def query(self, line: Line) -> list[Line]:
+        """Returns the indexed lines whose bounding boxes overlap line's."""
+        candidates: set[int] = set()
+        for cell in self._overlapping_cells(line.bounds):
+            candidates.update(self._cells.get(cell, ()))
+        return [self._lines[i] for i in sorted(candidates) if self._lines[i].overlaps(line)]
+
+
 class Ray(Line):
     """A ray is a line that starts at a point and extends infinitely in one direction."""
-    def __init__(self, start: Point, end: Point):
-        super().__init__(start, end)
-        self._direction = self.angle
-    
+    __slots__ = ()
+
     @property
     def direction(self) -> float:
-        return self._direction
+        return self.angle
 
-class Vect(Line):
+class Vect(Ray):
     """A vector is a line with a direction and magnitude."""
-    def __init__(self, start: Point, end: Point):
-        super().__init__(start, end)
-        self._magnitude = self.length
-        self._direction = self.angle
-    
+    __slots__ = ()
+
     @property
     def magnitude(self) -> float:
-        return self._magnitude
-    
-    @property
-    def direction(self) -> float:
-        return self._direction
+        return self.length
     
     
 class Polygon(Shape):
     """A polygon is defined by its vertices. The vertices must be provided in order (clockwise or counter-clockwise)."""
+    __slots__ = ('vertices', '_xs', '_ys', '_edges', '_hash')
+
     def __init__(self, *vertices: Point):
         if len(vertices) < 3:
             raise ValueError("A polygon must have at least 3 vertices.")
-        self.vertices: tuple[Point, ...] = tuple(vertex for vertex in vertices)
+        self.vertices: tuple[Point, ...] = vertices
+        # Flat coordinate tuples so the geometric reductions below run on
+        # plain floats instead of chasing Point attributes per iteration.
+        self._xs: tuple[float, ...] = tuple(vertex.p_x for vertex in vertices)
+        self._ys: tuple[float, ...] = tuple(vertex.p_y for vertex in vertices)
+        self._edges: tuple[Line, ...] | None = None
+        self._hash: int | None = None
 
     def __repr__(self):
         return f"{type(self).__name__}({', '.join(map(str, self.vertices))})"
+
+    def _hash_key(self) -> tuple:
+        # The flat coordinate tuples hash and compare as C-level float
+        # tuples, avoiding a Point.__hash__ call per vertex.
+        return (self._xs, self._ys)
+
+    def __eq__(self, value: object) -> bool:
+        if type(value) is not type(self):
+            return NotImplemented
+        return self._xs == value._xs and self._ys == value._ys
+
+    __hash__ = Shape.__hash__
     
 
     @property
     def center(self) -> Point:
-        x = sum(vertex.p_x for vertex in self.vertices) / len(self.vertices)
-        y = sum(vertex.p_y for vertex in self.vertices) / len(self.vertices)
-        return Point(x, y)
+        # Summing the flat coordinate tuples runs at C level, with no
+        # generator frames or per-vertex attribute loads.
+        n = len(self._xs)
+        return Point._make(sum(self._xs) / n, sum(self._ys) / n)
     
     @property
     def edges(self) -> tuple[Line, ...]:
-        edges: list[Line] = []
-        for i in range(len(self.vertices)):
-            start = self.vertices[i]
-            end = self.vertices[(i + 1) % len(self.vertices)]
-            edges.append(Line(start, end))
-        return tuple(edges)
+        # Vertices are fixed after construction, so build the edges once.
+        # Zipping the vertex tuple against its rotation pairs each vertex
+        # with its successor without any per-index modulo arithmetic.
+        if self._edges is None:
+            shifted = self.vertices[1:] + self.vertices[:1]
+            self._edges = tuple(Line(start, end) for start, end in zip(self.vertices, shifted))
+        return self._edges
     
     @property
     def area(self) -> float:
-        area: float = 0.0
-        for i in range(len(self.vertices)):
-            j = (i + 1) % len(self.vertices)
-            area += self.vertices[i].p_x * self.vertices[j].p_y
-            area -= self.vertices[j].p_x * self.vertices[i].p_y
-        return abs(area) / 2.0  
+        return _poly_area(self._xs, self._ys)
 
     @property
     def perimeter(self) -> float:
-        perimeter: float = 0.0
-        for edge in self.edges:
-            perimeter += edge.length
-        return perimeter  
+        return _poly_perimeter(self._xs, self._ys)
 
 
 class Circle(Shape):
+    __slots__ = ('_p_x', '_p_y', '_r', '_edges_cache', '_hash')
+
     def __init__(self, p_x: float, p_y: float, r: float):
+        if r <= 0:
+            raise ValueError("Radius must be positive.")
         self._p_x: float = p_x
         self._p_y: float = p_y
 
         self._r: float = r
+        self._edges_cache: tuple[tuple[float, float, float], tuple[Line, ...]] | None = None
+        self._hash: int | None = None
 
-    def __post_init__(self):
-        if self._r <= 0:
-            raise ValueError("Radius must be positive.")
-        
     @classmethod
     def from_point(cls, point: Point, radius: float) -> Circle:
         return cls(p_x=point.p_x, p_y=point.p_y, r=radius)
 
     def __repr__(self):
         return f"Circle(x={self._p_x}, y={self._p_y}, radius={self._r})"
-    
+
+    def _hash_key(self) -> tuple:
+        return (self._p_x, self._p_y, self._r)
+
     def __eq__(self, value: object) -> bool:
-        return super().__eq__(value)
-    
+        if type(value) is not type(self):
+            return NotImplemented
+        return (self._p_x, self._p_y, self._r) == (value._p_x, value._p_y, value._r)
+
+    __hash__ = Shape.__hash__
+
     @property
     def perimeter(self) -> float:
         return 2 * math.pi * self._r
@@ -209,16 +432,16 @@ class Circle(Shape):
     
     @property
     def edges(self) -> tuple[Line, ...]:
-        # For a circle, we can represent the edges as a series of lines forming a polygonal approximation
-        num_edges = 36  # Number of edges to approximate the circle
-        edges: list[Line] = []
-        for i in range(num_edges):
-            angle1 = (2 * math.pi / num_edges) * i
-            angle2 = (2 * math.pi / num_edges) * (i + 1)
-            start = Point(self._p_x + self._r * math.cos(angle1), self._p_y + self._r * math.sin(angle1))
-            end = Point(self._p_x + self._r * math.cos(angle2), self._p_y + self._r * math.sin(angle2))
-            edges.append(Line(start, end))
-        return tuple(edges)
+        # For a circle, we can represent the edges as a series of lines forming a polygonal approximation.
+        # Cached against (x, y, r) so repeated queries on an unmoved circle are free.
+        key = (self._p_x, self._p_y, self._r)
+        if self._edges_cache is None or self._edges_cache[0] != key:
+            points = [
+                Point._make(self._p_x + self._r * cos, self._p_y + self._r * sin)
+                for cos, sin in zip(_CIRCLE_COS, _CIRCLE_SIN)
+            ]
+            self._edges_cache = (key, tuple(Line(points[i], points[i + 1]) for i in range(_CIRCLE_EDGE_COUNT)))
+        return self._edges_cache[1]
     
     @property
     def top(self):
@@ -238,6 +461,8 @@ class Circle(Shape):
 
 
 class Ball(Circle):
+    __slots__ = ('_v_x', '_v_y', '_a_x', '_a_y')
+
     def __init__(self, *, p_x: float, p_y: float, v_x: float, v_y: float, a_x: float, a_y: float, r: float):
         super().__init__(p_x=p_x, p_y=p_y, r=r)
         self._v_x = v_x
@@ -247,6 +472,16 @@ class Ball(Circle):
 
     def __repr__(self):
         return f"Ball(x={self.p_x}, y={self.p_y}, v_x={self.v_x}, v_y={self.v_y}, a_x={self.a_x}, a_y={self.a_y}, radius={self.r})"
+
+    def _hash_key(self) -> tuple:
+        return (self._p_x, self._p_y, self._r, self._v_x, self._v_y, self._a_x, self._a_y)
+
+    def __eq__(self, value: object) -> bool:
+        if type(value) is not type(self):
+            return NotImplemented
+        return self._hash_key() == value._hash_key()
+
+    __hash__ = Shape.__hash__
     
     @classmethod
     def from_bearing(cls, *, p_x: float, p_y: float, v_m: float, v_d: float, a_m: float = 0.0, a_d: float = 0.0, r: float = 1.0) -> Ball:
@@ -259,13 +494,14 @@ class Ball(Circle):
         if v_d < 0 or v_d > 360 or a_d < 0 or a_d > 360:
             raise ValueError("Direction must be between 0 and 360 degrees.")
         
-        # Convert polar coordinates to Cartesian coordinates
-        # _p_x = p_m * math.cos(math.radians(p_d))
-        # _p_y = p_m * math.sin(math.radians(p_d))        
-        _v_x = v_m * math.cos(math.radians(v_d))
-        _v_y = v_m * -math.sin(math.radians(v_d))
-        _a_x = a_m * math.cos(math.radians(a_d))
-        _a_y = a_m * -math.sin(math.radians(a_d))
+        # Convert polar coordinates to Cartesian coordinates,
+        # converting each angle to radians once.
+        v_rad = math.radians(v_d)
+        a_rad = math.radians(a_d)
+        _v_x = v_m * math.cos(v_rad)
+        _v_y = -v_m * math.sin(v_rad)
+        _a_x = a_m * math.cos(a_rad)
+        _a_y = -a_m * math.sin(a_rad)
 
         return cls(p_x=p_x, p_y=p_y, v_x=_v_x, v_y=_v_y, a_x=_a_x, a_y=_a_y, r=r)
     
@@ -303,16 +539,13 @@ class Ball(Circle):
     
     @property
     def v_m(self) -> float:
-        return (self._v_x**2 + self._v_y**2)**0.5
+        return _hypot2(self._v_x, self._v_y)
     
     @property
     def v_d(self) -> float:
-        if self.v_x == 0 and self.v_y == 0:
-            return 0.0
-        if self.v_x == 0:
-            return 270 if self.v_y > 0 else 90
-        raw_deg: float = math.degrees(math.atan2(-self.v_y, self.v_x))
-        return raw_deg + 360 if raw_deg < 0 else raw_deg
+        # atan2 covers the vertical and zero cases, and % 360.0 on a
+        # float is already non-negative, so no sign branches are needed.
+        return math.degrees(math.atan2(-self._v_y, self._v_x)) % 360.0
 
     @property
     def a_x(self) -> float:
@@ -324,61 +557,34 @@ class Ball(Circle):
     
     @property
     def a_m(self) -> float:
-        return (self._a_x**2 + self._a_y**2)**0.5
+        return _hypot2(self._a_x, self._a_y)
     
     @property
     def a_d(self) -> float:
-        if self.a_x == 0 and self.a_y == 0:
-            return 0.0
-        if self.a_x == 0:
-            return 270 if self.a_y > 0 else 90
-        raw_deg: float = math.degrees(math.atan2(-self.a_y, self.a_x))
-        return raw_deg + 360 if raw_deg < 0 else raw_deg
+        return math.degrees(math.atan2(-self._a_y, self._a_x)) % 360.0
 
     
     @p_x.setter
     def p_x(self, value: float):
         self._p_x = value
-        if self.v_m == 0:
-            self._v_x = 0
-            self._v_y = 0
-        if self.a_m == 0:
-            self._a_x = 0
-            self._a_y = 0
 
     @p_y.setter
     def p_y(self, value: float):
         self._p_y = value
-        if self.v_m == 0:
-            self._v_x = 0
-            self._v_y = 0
-        if self.a_m == 0:
-            self._a_x = 0
-            self._a_y = 0
 
     @r.setter
     def r(self, value: float):
         if value <= 0:
             raise ValueError("Radius must be positive.")
         self._r = value
-        if self.v_m == 0:
-            self._v_x = 0
-            self._v_y = 0
-        if self.a_m == 0:
-            self._a_x = 0
-            self._a_y = 0
 
     @v_x.setter
     def v_x(self, value: float):
         self._v_x = value
-        if self.v_m == 0:
-            self._v_y = 0
 
     @v_y.setter
     def v_y(self, value: float):
         self._v_y = value
-        if self.v_m == 0:
-            self._v_x = 0
     
     @v_m.setter
     def v_m(self, value: float):
@@ -394,27 +600,20 @@ class Ball(Circle):
 
     @v_d.setter
     def v_d(self, value: float):
-        if self.v_m == 0:
+        magnitude = self.v_m
+        if magnitude == 0:
             return
-        if value < 0:
-            value = (value % 360) + 360
-        if value > 360:
-            value = (value % 360)
-        rad = math.radians(value)
-        self._v_x = self.v_m * math.cos(rad)
-        self._v_y = self.v_m * math.sin(rad)
+        rad = math.radians(value % 360.0)
+        self._v_x = magnitude * math.cos(rad)
+        self._v_y = -magnitude * math.sin(rad)
 
     @a_x.setter
     def a_x(self, value: float):
         self._a_x = value
-        if self.a_m == 0:
-            self._a_y = 0
 
     @a_y.setter
     def a_y(self, value: float):
         self._a_y = value
-        if self.a_m == 0:
-            self._a_x = 0
 
     @a_m.setter
     def a_m(self, value: float):
@@ -430,18 +629,17 @@ class Ball(Circle):
 
     @a_d.setter
     def a_d(self, value: float):
-        if self.a_m == 0:
+        magnitude = self.a_m
+        if magnitude == 0:
             return
-        if value < 0:
-            value = (value % 360) + 360
-        if value > 360:
-            value = (value % 360)
-        rad = math.radians(value)
-        self._a_x = self.a_m * math.cos(rad)
-        self._a_y = self.a_m * math.sin(rad)
+        rad = math.radians(value % 360.0)
+        self._a_x = magnitude * math.cos(rad)
+        self._a_y = -magnitude * math.sin(rad)
 
 
 class Rectangle(Shape):
+    __slots__ = ('x', 'y', 'width', 'height', '_edges', '_hash')
+
     def __init__(self, x: float, y: float, width: float, height: float):
         if width <= 0 or height <= 0:
             raise ValueError("Width and height must be positive.")
@@ -449,9 +647,21 @@ class Rectangle(Shape):
         self.y = y
         self.width = width
         self.height = height
+        self._edges: tuple[Line, ...] | None = None
+        self._hash: int | None = None
 
     def __repr__(self):
         return f"Rectangle(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+
+    def _hash_key(self) -> tuple:
+        return (self.x, self.y, self.width, self.height)
+
+    def __eq__(self, value: object) -> bool:
+        if type(value) is not type(self):
+            return NotImplemented
+        return (self.x, self.y, self.width, self.height) == (value.x, value.y, value.width, value.height)
+
+    __hash__ = Shape.__hash__
     
     @property
     def perimeter(self) -> float:
@@ -467,33 +677,59 @@ class Rectangle(Shape):
     
     @property
     def edges(self) -> tuple[Line, ...]:
-        top_left = Point(self.x, self.y)
-        top_right = Point(self.x + self.width, self.y)
-        bottom_left = Point(self.x, self.y + self.height)
-        bottom_right = Point(self.x + self.width, self.y + self.height)
-        
-        return (
-            Line(top_left, top_right),
-            Line(top_right, bottom_right),
-            Line(bottom_right, bottom_left),
-            Line(bottom_left, top_left),
-        )
+        # Rectangles have no setters and are treated as immutable, so
+        # the corner Points and edge Lines are built once and cached.
+        if self._edges is None:
+            top_left = Point(self.x, self.y)
+            top_right = Point(self.x + self.width, self.y)
+            bottom_left = Point(self.x, self.y + self.height)
+            bottom_right = Point(self.x + self.width, self.y + self.height)
+
+            self._edges = (
+                Line(top_left, top_right),
+                Line(top_right, bottom_right),
+                Line(bottom_right, bottom_left),
+                Line(bottom_left, top_left),
+            )
+        return self._edges
 
 
 
 class SurfaceType(Enum):
-    OUT = auto()
-    IN = auto()
-    DOUBLE = auto()
+    """Which side of the surface is solid. The value is the sign applied
+    to the signed point-to-surface distance; 0 means use the absolute
+    value (solid on both sides)."""
+    OUT = 1
+    IN = -1
+    DOUBLE = 0
 
 
 
 class Surface(Line):
+    __slots__ = ('surface_type', 'bounce_constant', 'friction', '_hash')
+
     def __init__(self, *, start: Point, end: Point, surface_type: SurfaceType, bounce_constant: float = 1.0, friction: float = 1.0):
         super().__init__(start, end)
         self.surface_type: SurfaceType = surface_type
         self.bounce_constant: float = bounce_constant
         self.friction: float = friction
+        self._hash: int | None = None
+
+    def __eq__(self, value: object) -> bool:
+        if type(value) is not type(self):
+            return NotImplemented
+        return (self.coords == value.coords
+                and self.surface_type is value.surface_type
+                and self.bounce_constant == value.bounce_constant
+                and self.friction == value.friction)
+
+    def __hash__(self) -> int:
+        """Hash of the endpoint coordinates and material fields, computed
+        once per instance. Surfaces are immutable in practice, so the
+        cached value never goes stale."""
+        if self._hash is None:
+            self._hash = hash((self.coords, self.surface_type, self.bounce_constant, self.friction))
+        return self._hash
 
     def __repr__(self):
         if self.bounce_constant == 1.0 and self.friction == 1.0: